@@ -0,0 +1,31 @@
+"""OpenCV card analysis package."""
+import importlib
+
+# Public names resolved on first access (PEP 562): `import analysis` stays
+# cheap, and only the submodule that provides the requested name is loaded.
+_LAZY_EXPORTS = {
+    "calculate_centering_ratios": ".centering",
+    "calculate_centering_ratios_batch": ".centering",
+    "calculate_centering_score": ".centering",
+    "calculate_centering_scores": ".centering",
+    "detect_inner_artwork_box": ".centering",
+    "analyze_corners": ".corners",
+    "CornerDetector": ".corners",
+    "detect_border_wear": ".texture",
+    "grade_batch": ".batch",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -5,7 +5,13 @@ Uses gradient-based border detection for reliable measurements.
 import cv2
 import numpy as np
 import logging
-from typing import Dict, Optional, Tuple
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from .preprocessed import PreprocessedCard, as_preprocessed, read_image
 from .vision.image_preprocessing import (
     find_card_contour,
     get_card_corners,
@@ -49,6 +55,80 @@ BACK_CAP_TABLE = [
 ]
 
 
+# Breakpoints for calculate_centering_score: average L/R + T/B ratio -> score.
+# Dampened scoring curve — wider brackets in the mid-range (0.5-0.8) to reduce
+# sensitivity to measurement noise. Top band 9.0→10.0 spans 0.93–0.975 (was
+# 0.95–0.975); the previous 0.025 range (~6px on a 500px card) was within
+# natural noise, so a well-centred card could randomly score 9.0 instead of 10.0.
+# Dampened bands: 0.75–0.85 → 1.0 grade (was 0.05 → 1.0); 0.60–0.75 → 1.0 grade
+# (was 0.10 → 2.0).
+# Below 0.45 the score falls linearly towards 0 and is floored at 2.0 (ratio 0.225).
+CENTERING_SCORE_RATIOS = np.array([0.225, 0.45, 0.60, 0.75, 0.85, 0.90, 0.93, 0.975])
+CENTERING_SCORE_VALUES = np.array([2.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0])
+
+# Largest side the centering detectors work on. Matches the 500x700 output of
+# perspective_correct_card, so warped cards are analysed as-is; larger
+# pre-corrected inputs are downsampled to it and the widths scaled back.
+CENTERING_ANALYSIS_MAX_DIM = 700
+
+
+# Perspective-corrected cards keyed by (path, mtime_ns, size), so re-analysing
+# an unchanged upload skips contour detection and the warp. Corrected cards are
+# ~500x700x3 (~1 MB), so the cache tops out around 32 MB.
+_CORRECTED_CACHE_SIZE = 32
+_corrected_cache: "OrderedDict[Tuple[str, int, int], np.ndarray]" = OrderedDict()
+_corrected_cache_lock = threading.Lock()
+
+
+# Per-thread scratch arrays for the full-card intermediates (edges, gradients,
+# threshold masks). Every warped card is the same 500x700, so after the first
+# card each call reuses its thread's buffers instead of allocating new ones.
+# Only for values that don't outlive the call that fills them.
+_scratch_buffers = threading.local()
+
+
+def _scratch(name: str, shape: Tuple[int, ...], dtype) -> np.ndarray:
+    """Thread-local uninitialised buffer for `name`, reallocated when shape/dtype change."""
+    buffers = getattr(_scratch_buffers, "by_name", None)
+    if buffers is None:
+        buffers = _scratch_buffers.by_name = {}
+    buf = buffers.get(name)
+    if buf is None or buf.shape != shape or buf.dtype != dtype:
+        buf = buffers[name] = np.empty(shape, dtype=dtype)
+    return buf
+
+
+def _file_version(path: str) -> Optional[Tuple[str, int, int]]:
+    """Cache key that changes whenever the file is rewritten."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return os.path.abspath(path), st.st_mtime_ns, st.st_size
+
+
+def _get_cached_corrected(key: Optional[Tuple[str, int, int]]) -> Optional[np.ndarray]:
+    if key is None:
+        return None
+    with _corrected_cache_lock:
+        corrected = _corrected_cache.get(key)
+        if corrected is not None:
+            _corrected_cache.move_to_end(key)
+        return corrected
+
+
+def _put_cached_corrected(key: Optional[Tuple[str, int, int]], corrected: np.ndarray) -> None:
+    if key is None:
+        return
+    # Shared between callers, so hand out a read-only array.
+    corrected.flags.writeable = False
+    with _corrected_cache_lock:
+        _corrected_cache[key] = corrected
+        _corrected_cache.move_to_end(key)
+        while len(_corrected_cache) > _CORRECTED_CACHE_SIZE:
+            _corrected_cache.popitem(last=False)
+
+
 def lookup_centering_cap(ratio: float, table: list) -> int:
     """Return PSA centering cap for the given min/max border ratio."""
     for threshold, cap in table:
@@ -97,114 +177,245 @@ def _centering_cap_and_score(
     return cap, round(score, 2)
 
 
-def detect_inner_artwork_box(image: np.ndarray) -> Optional[np.ndarray]:
+def detect_inner_artwork_box(
+    image: Union[np.ndarray, PreprocessedCard],
+) -> Optional[np.ndarray]:
     """
     Detect the inner artwork/text box of a Pokémon card.
     
     Args:
-        image: Card image (should be perspective-corrected)
+        image: Card image or PreprocessedCard (should be perspective-corrected)
         
     Returns:
         Bounding rectangle [x, y, w, h] or None
     """
-    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    
-    # Apply Gaussian blur
-    blurred = cv2.GaussianBlur(gray, (5, 5), 0)
+    card = as_preprocessed(image)
+
+    # Gaussian-blurred grayscale
+    blurred = card.blurred_gray(5)
     
     # Canny edge detection
-    edges = cv2.Canny(blurred, 50, 150)
-    
-    # Find contours
+    edges = cv2.Canny(blurred, 50, 150, edges=_scratch("edges", blurred.shape, np.uint8))
+
+    img_height, img_width = card.shape[:2]
+    card_area = img_width * img_height
+
+    # Cheap pre-check before the contour search: a valid box lies inside the
+    # 5% margin and encloses >= 15% of the card. Enclosing area S needs a
+    # perimeter >= 2*sqrt(pi*S); boundary tracing takes steps <= sqrt(2) and
+    # visits an edge pixel at most 4 times, so fewer than sqrt(pi*S/8) edge
+    # pixels inside the margin can't outline any valid box.
+    inner_edges = edges[
+        int(img_height * 0.05):int(np.ceil(img_height * 0.95)),
+        int(img_width * 0.05):int(np.ceil(img_width * 0.95)),
+    ]
+    if cv2.countNonZero(inner_edges) < np.sqrt(np.pi * card_area * 0.15 / 8):
+        return None
+
+    # Contours are traced per 8-connected edge component, and a contour's area
+    # can't exceed its component's bounding box. Drop components whose bbox is
+    # under the 15% floor before tracing; most Canny fragments are texture.
+    _, labels, stats, _ = cv2.connectedComponentsWithStats(edges, connectivity=8)
+    keep = stats[:, cv2.CC_STAT_WIDTH] * stats[:, cv2.CC_STAT_HEIGHT] >= card_area * 0.15
+    keep[0] = False  # background
+    if not keep.any():
+        return None
+    edges = keep.astype(np.uint8)[labels]
+
+    # Find contours. Only the outline set is used, never the nesting, so skip
+    # building the hierarchy (RETR_EXTERNAL would drop the nested artwork frame).
     contours, _ = cv2.findContours(
         edges,
-        cv2.RETR_TREE,
+        cv2.RETR_LIST,
         cv2.CHAIN_APPROX_SIMPLE
     )
     
-    # Filter contours by area and position
-    valid_boxes = []
-    img_height, img_width = image.shape[:2]
-    
-    for cnt in contours:
-        area = cv2.contourArea(cnt)
-        
-        # Artwork box should be significant but not entire card
-        # Typically 15-70% of card area
-        if area < (img_width * img_height * 0.15):
-            continue
-        if area > (img_width * img_height * 0.70):
-            continue
-        
-        x, y, w, h = cv2.boundingRect(cnt)
-        
-        # Exclude contours touching any card edge — likely the card boundary itself
-        margin = 0.05
-        if (x < img_width * margin or y < img_height * margin or
-                x + w > img_width * (1 - margin) or y + h > img_height * (1 - margin)):
-            continue
-        
-        # Should have reasonable aspect ratio for a card element
-        aspect = w / h
-        if aspect < 0.5 or aspect > 2.0:
-            continue
-        
-        valid_boxes.append((x, y, w, h))
-    
-    if not valid_boxes:
+    if not contours:
         return None
-    
+
+    # Artwork box should be significant but not entire card
+    # Typically 15-70% of card area
+    areas = np.fromiter((cv2.contourArea(cnt) for cnt in contours), dtype=np.float64, count=len(contours))
+    candidates = np.flatnonzero((areas >= card_area * 0.15) & (areas <= card_area * 0.70))
+    if candidates.size == 0:
+        return None
+
+    # Bounding boxes of the survivors only, filtered together as arrays
+    boxes = np.array([cv2.boundingRect(contours[i]) for i in candidates])
+    x, y, w, h = boxes.T
+
+    # Exclude contours touching any card edge — likely the card boundary itself
+    margin = 0.05
+    inside = (
+        (x >= img_width * margin) & (y >= img_height * margin)
+        & (x + w <= img_width * (1 - margin)) & (y + h <= img_height * (1 - margin))
+    )
+
+    # Should have reasonable aspect ratio for a card element
+    aspect = w / h
+    valid = inside & (aspect >= 0.5) & (aspect <= 2.0)
+    if not valid.any():
+        return None
+
     # Return largest valid box (likely the artwork frame)
-    return max(valid_boxes, key=lambda box: box[2] * box[3])
+    valid_boxes = boxes[valid]
+    best = valid_boxes[np.argmax(valid_boxes[:, 2] * valid_boxes[:, 3])]
+    return tuple(int(v) for v in best)
 
 
-def _detect_border_widths_gradient_single(
-    gray: np.ndarray,
-    h: int,
-    w: int,
-    sobel_threshold: int = 40,
-) -> Tuple[float, float, float, float]:
-    """Single-pass gradient border detection with a given Sobel threshold."""
-    # Compute gradients
-    grad_x = np.abs(cv2.Sobel(gray, cv2.CV_64F, 1, 0, ksize=3))
-    grad_y = np.abs(cv2.Sobel(gray, cv2.CV_64F, 0, 1, ksize=3))
+def _median_exceeds(values: np.ndarray, threshold: float) -> bool:
+    """
+    np.median(values) > threshold, decided by counting rather than partitioning.
 
-    # Normalize to 0-255
-    grad_x = (grad_x / grad_x.max() * 255).astype(np.uint8) if grad_x.max() > 0 else grad_x.astype(np.uint8)
-    grad_y = (grad_y / grad_y.max() * 255).astype(np.uint8) if grad_y.max() > 0 else grad_y.astype(np.uint8)
+    With n values of which c are <= threshold, the median exceeds it when the
+    middle element(s) do. Only an even n with c == n/2 straddles the threshold;
+    then the two middle elements are the largest value <= threshold and the
+    smallest above it, averaged exactly as np.median does.
+    """
+    n = values.size
+    at_or_below = values <= threshold
+    c = np.count_nonzero(at_or_below)
+    half = n // 2
+    if n % 2:
+        return c <= half
+    if c != half:
+        return c < half
+    lower = values[at_or_below].max()
+    upper = values[~at_or_below].min()
+    return (lower + upper) / 2 > threshold
+
+
+def _first_line(mask: np.ndarray, lines: range, axis: int, hit) -> Optional[int]:
+    """
+    First index in `lines` (columns if axis=1, rows if axis=0) whose mean over
+    the uint8 mask satisfies `hit`, or None. The whole scanned strip is summed
+    in one cv2.reduce call (integer sums, so the means match np.mean exactly).
+    """
+    if not lines:
+        return None
+    lo, hi = min(lines[0], lines[-1]), max(lines[0], lines[-1]) + 1
+    if axis == 1:
+        strip = mask[:, lo:hi]
+        means = cv2.reduce(strip, 0, cv2.REDUCE_SUM, dtype=cv2.CV_32S)[0] / strip.shape[0]
+    else:
+        strip = mask[lo:hi, :]
+        means = cv2.reduce(strip, 1, cv2.REDUCE_SUM, dtype=cv2.CV_32S)[:, 0] / strip.shape[1]
+    if lines.step < 0:
+        means = means[::-1]
+    hits = hit(means)
+    first = int(np.argmax(hits))  # first True; 0 when there is none
+    return lines[first] if hits[first] else None
+
+
+def _abs_gradients(gray: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """|Sobel x|, |Sobel y| (3x3) of a uint8 image, as int16 from one spatialGradient pass."""
+    grad_x, grad_y = cv2.spatialGradient(
+        gray,
+        dx=_scratch("grad_x", gray.shape, np.int16),
+        dy=_scratch("grad_y", gray.shape, np.int16),
+    )
+    return np.abs(grad_x, out=grad_x), np.abs(grad_y, out=grad_y)
+
+
+@lru_cache(maxsize=256)
+def _normalized_cutoff(grad_max: int, sobel_threshold: int) -> Optional[int]:
+    """
+    Smallest |gradient| that exceeds `sobel_threshold` once max-normalised to
+    0-255 and truncated to uint8, or None if none does.
+
+    Sobel values are small integers, so the normalise + truncation is evaluated
+    once per possible value (same float ops) instead of over the whole image.
+    """
+    if grad_max <= 0:
+        return None
+    normalized = (np.arange(grad_max + 1) / grad_max * 255).astype(np.uint8)
+    passing = np.flatnonzero(normalized > sobel_threshold)
+    return int(passing[0]) if passing.size else None
 
-    # Threshold to find strong edges
-    _, strong_x = cv2.threshold(grad_x, sobel_threshold, 255, cv2.THRESH_BINARY)
-    _, strong_y = cv2.threshold(grad_y, sobel_threshold, 255, cv2.THRESH_BINARY)
 
+def _strong_edges(abs_grad: np.ndarray, grad_max: int, sobel_threshold: int, name: str) -> np.ndarray:
+    """0/255 mask of gradients above `sobel_threshold` after max-normalising to 0-255."""
+    cutoff = _normalized_cutoff(grad_max, sobel_threshold)
+    if cutoff is None:
+        return np.zeros(abs_grad.shape, dtype=np.uint8)
+    return cv2.compare(abs_grad, cutoff, cv2.CMP_GE, dst=_scratch(name, abs_grad.shape, np.uint8))
+
+
+def _scan_edges(
+    mask_x: np.ndarray,
+    mask_y: np.ndarray,
+    scans: Tuple[range, range, range, range],
+    hit,
+) -> Tuple[Optional[int], Optional[int], Optional[int], Optional[int]]:
+    """
+    Run the left/right (columns of mask_x) and top/bottom (rows of mask_y)
+    border scans in one call. Returns each border's width measured from its
+    own edge, or None where the scan found no qualifying line.
+    """
+    h, w = mask_x.shape[:2]
+    left_scan, right_scan, top_scan, bottom_scan = scans
+    left = _first_line(mask_x, left_scan, 1, hit)
+    right = _first_line(mask_x, right_scan, 1, hit)
+    top = _first_line(mask_y, top_scan, 0, hit)
+    bottom = _first_line(mask_y, bottom_scan, 0, hit)
+    return (
+        left,
+        None if right is None else w - 1 - right,
+        top,
+        None if bottom is None else h - 1 - bottom,
+    )
+
+
+@lru_cache(maxsize=8)
+def _gradient_scan_ranges(h: int, w: int) -> Tuple[range, range, range, range, int, int]:
+    """
+    Left/right/top/bottom scan ranges and minimum borders for a h x w card.
+
+    They depend only on the card shape, which is the same 500x700 for every
+    warped card, so they're built once instead of on every threshold pass.
+    """
     scan_limit = min(w // 4, 150)
     scan_limit_y = min(h // 4, 150)
     min_border_w = max(1, int(w * 0.02))
     min_border_h = max(1, int(h * 0.02))
+    return (
+        range(min_border_w, scan_limit),
+        range(w - 1 - min_border_w, w - scan_limit, -1),
+        range(min_border_h, scan_limit_y),
+        range(h - 1 - min_border_h, h - scan_limit_y, -1),
+        min_border_w,
+        min_border_h,
+    )
 
-    left_width = min_border_w
-    for x in range(min_border_w, scan_limit):
-        if np.mean(strong_x[:, x]) > 30:
-            left_width = x
-            break
-
-    right_width = min_border_w
-    for x in range(w - 1 - min_border_w, w - scan_limit, -1):
-        if np.mean(strong_x[:, x]) > 30:
-            right_width = w - 1 - x
-            break
-
-    top_width = min_border_h
-    for y in range(min_border_h, scan_limit_y):
-        if np.mean(strong_y[y, :]) > 30:
-            top_width = y
-            break
-
-    bottom_width = min_border_h
-    for y in range(h - 1 - min_border_h, h - scan_limit_y, -1):
-        if np.mean(strong_y[y, :]) > 30:
-            bottom_width = h - 1 - y
-            break
+
+def _detect_border_widths_gradient_single(
+    abs_x: np.ndarray,
+    abs_y: np.ndarray,
+    max_x: int,
+    max_y: int,
+    h: int,
+    w: int,
+    sobel_threshold: int = 40,
+) -> Tuple[float, float, float, float]:
+    """Single-pass gradient border detection on precomputed |Sobel| (and maxima) with a given threshold."""
+    # Threshold to find strong edges
+    strong_x = _strong_edges(abs_x, max_x, sobel_threshold, "strong_x")
+    strong_y = _strong_edges(abs_y, max_y, sobel_threshold, "strong_y")
+
+    *scans, min_border_w, min_border_h = _gradient_scan_ranges(h, w)
+
+    def strong(means):
+        return means > 30
+
+    left_width, right_width, top_width, bottom_width = _scan_edges(strong_x, strong_y, scans, strong)
+    if left_width is None:
+        left_width = min_border_w
+    if right_width is None:
+        right_width = min_border_w
+    if top_width is None:
+        top_width = min_border_h
+    if bottom_width is None:
+        bottom_width = min_border_h
 
     left_width = max(left_width, w * 0.02)
     right_width = max(right_width, w * 0.02)
@@ -214,7 +425,9 @@ def _detect_border_widths_gradient_single(
     return left_width, right_width, top_width, bottom_width
 
 
-def detect_border_widths_hsv(image: np.ndarray) -> Optional[Tuple[float, float, float, float]]:
+def detect_border_widths_hsv(
+    image: Union[np.ndarray, PreprocessedCard],
+) -> Optional[Tuple[float, float, float, float]]:
     """
     HSV outermost-colour border detection.
 
@@ -224,13 +437,14 @@ def detect_border_widths_hsv(image: np.ndarray) -> Optional[Tuple[float, float,
     Pokémon cards (thick border + artwork frame + text) often fires on the wrong edge.
 
     Args:
-        image: Perspective-corrected card image (BGR)
+        image: Perspective-corrected card image (BGR) or PreprocessedCard
 
     Returns:
         (left, right, top, bottom) border widths, or None if detection failed.
     """
-    h, w = image.shape[:2]
-    hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+    card = as_preprocessed(image)
+    h, w = card.shape[:2]
+    hsv = card.hsv
     hue = hsv[:, :, 0].astype(np.float32)
     sat = hsv[:, :, 1].astype(np.float32)
 
@@ -279,7 +493,7 @@ def detect_border_widths_hsv(image: np.ndarray) -> Optional[Tuple[float, float,
             # Circular hue distance
             diff = np.abs(col_hue.astype(float) - ref_hue)
             diff = np.minimum(diff, 180 - diff)
-            if np.median(diff) > HUE_TOL:
+            if _median_exceeds(diff, HUE_TOL):
                 width = (idx if not reverse else dim - 1 - idx)
                 return float(width)
         return None
@@ -316,7 +530,9 @@ def detect_border_widths_hsv(image: np.ndarray) -> Optional[Tuple[float, float,
     return left, right, top, bottom
 
 
-def detect_border_widths_gradient(image: np.ndarray) -> Tuple[float, float, float, float, bool, bool]:
+def detect_border_widths_gradient(
+    image: Union[np.ndarray, PreprocessedCard],
+) -> Tuple[float, float, float, float, bool, bool]:
     """
     Gradient-based border detection using median-of-3 for stability.
 
@@ -324,7 +540,7 @@ def detect_border_widths_gradient(image: np.ndarray) -> Tuple[float, float, floa
     and takes the median result, reducing sensitivity to threshold choice.
 
     Args:
-        image: Perspective-corrected card image
+        image: Perspective-corrected card image or PreprocessedCard
 
     Returns:
         Tuple of (left, right, top, bottom, symmetry_corrected, cross_axis_unreliable).
@@ -332,14 +548,19 @@ def detect_border_widths_gradient(image: np.ndarray) -> Tuple[float, float, floa
         cross_axis_unreliable: True if L/R and T/B averages differ by > 3× — strong signal
             that gradient fired on the wrong edges (e.g. artwork frame instead of outer border).
     """
-    h, w = image.shape[:2]
-    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    gray = cv2.GaussianBlur(gray, (3, 3), 0)
+    card = as_preprocessed(image)
+    h, w = card.shape[:2]
+    # Gradients don't depend on the threshold: compute them once for all three runs
+    abs_x, abs_y = _abs_gradients(card.blurred_gray(3))
+    # Likewise the normalisation maxima: one reduction per axis, not per threshold
+    max_x, max_y = int(abs_x.max()), int(abs_y.max())
 
     # Run at 3 thresholds and take median for each border
     results = []
     for threshold in (35, 40, 45):
-        results.append(_detect_border_widths_gradient_single(gray, h, w, threshold))
+        results.append(
+            _detect_border_widths_gradient_single(abs_x, abs_y, max_x, max_y, h, w, threshold)
+        )
 
     # Median of each border measurement
     left_width = sorted(r[0] for r in results)[1]
@@ -381,7 +602,9 @@ def detect_border_widths_gradient(image: np.ndarray) -> Tuple[float, float, floa
     return left_width, right_width, top_width, bottom_width, symmetry_corrected, cross_axis_unreliable
 
 
-def detect_border_widths(image: np.ndarray) -> Tuple[float, float, float, float]:
+def detect_border_widths(
+    image: Union[np.ndarray, PreprocessedCard],
+) -> Tuple[float, float, float, float]:
     """
     Fallback centering detection using border color analysis.
     
@@ -390,61 +613,42 @@ def detect_border_widths(image: np.ndarray) -> Tuple[float, float, float, float]
     Works better for holographic and full-art cards.
     
     Args:
-        image: Perspective-corrected card image
+        image: Perspective-corrected card image or PreprocessedCard
         
     Returns:
         Tuple of (left, right, top, bottom) border widths
     """
-    h, w = image.shape[:2]
-    
-    # Convert to HSV to detect saturated (colored) borders
-    hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
-    saturation = hsv[:, :, 1]
+    card = as_preprocessed(image)
+    h, w = card.shape[:2]
     
     # Borders are typically saturated (yellow, blue, etc.)
-    # Threshold to find saturated regions
-    _, border_mask = cv2.threshold(saturation, 60, 255, cv2.THRESH_BINARY)
-    
-    # Sample from center of each edge to find where border ends
-    # Left border: scan from left edge toward center
-    left_width = 0
-    for x in range(min(w // 4, 100)):  # Don't scan more than 1/4 of width
-        col = border_mask[:, x]
-        # If less than 60% of column is saturated, we've exited the border
-        if np.mean(col) < 150:  # 255 * 0.6 ≈ 153
-            left_width = x
-            break
-    else:
-        left_width = w // 20  # Fallback: assume 5% border
+    # Saturated regions: S > 60, selected straight from the HSV image so the
+    # strided saturation channel is never sliced out and thresholded separately
+    border_mask = cv2.inRange(
+        card.hsv, (0, 61, 0), (255, 255, 255),
+        _scratch("border_mask", (h, w), np.uint8),
+    )
     
-    # Right border: scan from right edge toward center
-    right_width = 0
-    for x in range(w - 1, max(w - w // 4, w - 100), -1):
-        col = border_mask[:, x]
-        if np.mean(col) < 150:
-            right_width = w - 1 - x
-            break
-    else:
+    # If less than 60% of a column/row is saturated, we've exited the border
+    def exited(means):
+        return means < 150  # 255 * 0.6 ≈ 153
+
+    # Scan from each edge toward center, no more than 1/4 of the dimension;
+    # fallback when the border never ends: assume 5% border
+    scans = (
+        range(min(w // 4, 100)),
+        range(w - 1, max(w - w // 4, w - 100), -1),
+        range(min(h // 4, 100)),
+        range(h - 1, max(h - h // 4, h - 100), -1),
+    )
+    left_width, right_width, top_width, bottom_width = _scan_edges(border_mask, border_mask, scans, exited)
+    if left_width is None:
+        left_width = w // 20
+    if right_width is None:
         right_width = w // 20
-    
-    # Top border: scan from top edge toward center
-    top_width = 0
-    for y in range(min(h // 4, 100)):
-        row = border_mask[y, :]
-        if np.mean(row) < 150:
-            top_width = y
-            break
-    else:
+    if top_width is None:
         top_width = h // 20
-    
-    # Bottom border: scan from bottom edge toward center  
-    bottom_width = 0
-    for y in range(h - 1, max(h - h // 4, h - 100), -1):
-        row = border_mask[y, :]
-        if np.mean(row) < 150:
-            bottom_width = h - 1 - y
-            break
-    else:
+    if bottom_width is None:
         bottom_width = h // 20
     
     # Ensure minimum border width (at least 2% of dimension)
@@ -479,34 +683,58 @@ def calculate_centering_score(
     
     # Average the two ratios
     avg_ratio = (lr_ratio + tb_ratio) / 2.0
-    
-    # Dampened scoring curve — wider brackets in the mid-range (0.5-0.8)
-    # to reduce sensitivity to measurement noise.
-    # Top band widened: 9.0→10.0 now spans 0.93–0.975 (was 0.95–0.975).
-    # The previous 0.025 range (~6px on a 500px card) was within natural noise;
-    # a well-centred card could randomly score 9.0 instead of 10.0.
-    if avg_ratio >= 0.975:
-        return 10.0
-    elif avg_ratio >= 0.93:
-        return 9.0 + (avg_ratio - 0.93) / 0.045
-    elif avg_ratio >= 0.90:
-        return 8.0 + (avg_ratio - 0.90) / 0.03
-    elif avg_ratio >= 0.85:
-        return 7.0 + (avg_ratio - 0.85) / 0.05
-    elif avg_ratio >= 0.75:
-        # Dampened: 0.10 ratio range → 1.0 grade (was 0.05 → 1.0)
-        return 6.0 + (avg_ratio - 0.75) / 0.10
-    elif avg_ratio >= 0.60:
-        # Dampened: 0.15 ratio range → 1.0 grade (was 0.10 → 2.0)
-        return 5.0 + (avg_ratio - 0.60) / 0.15
-    elif avg_ratio >= 0.45:
-        return 4.0 + (avg_ratio - 0.45) / 0.15
-    else:
-        return max(2.0, 4.0 * avg_ratio / 0.45)
+
+    # Piecewise-linear lookup; clamps to 2.0 / 10.0 outside the table.
+    return float(np.interp(avg_ratio, CENTERING_SCORE_RATIOS, CENTERING_SCORE_VALUES))
+
+
+def calculate_centering_scores(borders: np.ndarray) -> np.ndarray:
+    """
+    Batch form of calculate_centering_score for candidate border sets.
+
+    Args:
+        borders: Array of shape (N, 4) holding (left, right, top, bottom) rows
+
+    Returns:
+        Array of N scores, each identical to calculate_centering_score on that row
+    """
+    borders = np.asarray(borders, dtype=np.float64)
+    pairs = borders.reshape(-1, 2, 2)  # (N, axis, side)
+    lo = pairs.min(axis=2)
+    hi = pairs.max(axis=2)
+    ratios = np.divide(lo, hi, out=np.ones_like(lo), where=hi > 0)
+    avg_ratio = ratios.mean(axis=1)
+    return np.interp(avg_ratio, CENTERING_SCORE_RATIOS, CENTERING_SCORE_VALUES)
+
+
+def _split_pct(a: float, b: float) -> str:
+    """'a/b' share of a two-sided border in percent, e.g. '52.3/47.7'."""
+    total = a + b
+    if total <= 0:
+        return "50.0/50.0"
+    return f"{a / total * 100:.1f}/{b / total * 100:.1f}"
+
+
+def _border_measurements(left: float, right: float, top: float, bottom: float) -> Dict:
+    """
+    Build the measurements sub-dict returned by every centering method.
+
+    The percentage splits stay pre-formatted strings: they are part of the API
+    response and annotation.py draws them verbatim. Formatting happens here,
+    once, after the method is settled, rather than inline in each branch.
+    """
+    return {
+        "left_px": left,
+        "right_px": right,
+        "top_px": top,
+        "bottom_px": bottom,
+        "left_right_ratio": _split_pct(left, right),
+        "top_bottom_ratio": _split_pct(top, bottom),
+    }
 
 
 def calculate_centering_ratios(
-    image_path: str,
+    image: Union[str, np.ndarray],
     debug_output_path: Optional[str] = None,
     vision_border_fractions: Optional[Dict] = None,
     is_front: bool = True,
@@ -524,17 +752,22 @@ def calculate_centering_ratios(
     Includes validation to detect and handle unreliable measurements.
 
     Args:
-        image_path: Path to card image
+        image: Path to the card image, or the already-decoded BGR image (skips
+            the re-read; such arrays are never modified or cached)
         debug_output_path: Optional path to save debug visualization
-        already_corrected: True when image_path points to a pre-warped card image
-            (e.g. front_corrected.jpg from the detection stage). Skips find_card_contour
+        already_corrected: True when image is a pre-warped card image (e.g.
+            front_corrected.jpg from the detection stage). Skips find_card_contour
             and perspective_correct_card — avoids double-warp corruption.
 
     Returns:
         Dict with centering analysis results
     """
-    # Load image
-    image = cv2.imread(image_path)
+    # Load image, unless the caller already decoded it
+    if isinstance(image, np.ndarray):
+        caller_image, image_path = image, None
+    else:
+        caller_image, image_path = None, image
+        image = read_image(image_path)
     if image is None:
         return {
             "success": False,
@@ -566,19 +799,14 @@ def calculate_centering_ratios(
             lr_ratio = min(left, right) / max(left, right) if max(left, right) > 0 else 1.0
             tb_ratio = min(top, bottom) / max(top, bottom) if max(top, bottom) > 0 else 1.0
             score = calculate_centering_score(left, right, top, bottom)
-            total_lr = left + right
-            total_tb = top + bottom
-            left_pct   = (left   / total_lr * 100) if total_lr > 0 else 50.0
-            right_pct  = (right  / total_lr * 100) if total_lr > 0 else 50.0
-            top_pct    = (top    / total_tb * 100) if total_tb > 0 else 50.0
-            bottom_pct = (bottom / total_tb * 100) if total_tb > 0 else 50.0
             cap, cap_score = _centering_cap_and_score(lr_ratio, tb_ratio, is_front)
-            logger.info(
-                f"Centering via vision_ai: "
-                f"L={left:.0f} R={right:.0f} T={top:.0f} B={bottom:.0f} "
-                f"lr_ratio={lr_ratio:.3f} tb_ratio={tb_ratio:.3f} score={score:.1f} "
-                f"cap={cap} cap_score={cap_score}"
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"Centering via vision_ai: "
+                    f"L={left:.0f} R={right:.0f} T={top:.0f} B={bottom:.0f} "
+                    f"lr_ratio={lr_ratio:.3f} tb_ratio={tb_ratio:.3f} score={score:.1f} "
+                    f"cap={cap} cap_score={cap_score}"
+                )
             return {
                 "success": True,
                 "score": round(score, 1),
@@ -586,14 +814,7 @@ def calculate_centering_ratios(
                 "detection_method": "vision_ai",
                 "lr_ratio": round(lr_ratio, 4),
                 "tb_ratio": round(tb_ratio, 4),
-                "measurements": {
-                    "left_px": left,
-                    "right_px": right,
-                    "top_px": top,
-                    "bottom_px": bottom,
-                    "left_right_ratio": f"{left_pct:.1f}/{right_pct:.1f}",
-                    "top_bottom_ratio": f"{top_pct:.1f}/{bottom_pct:.1f}",
-                },
+                "measurements": _border_measurements(left, right, top, bottom),
                 "confidence": 0.90,
                 "centering_cap": cap,
                 "centering_score": cap_score,    # worst-axis — used for cap enforcement
@@ -612,33 +833,53 @@ def calculate_centering_ratios(
     if already_corrected:
         corrected = image
     else:
-        card_contour = find_card_contour(image)
-        if card_contour is None:
-            return {
-                "success": False,
-                "error": "Could not detect card boundary",
-                "score": 5.0,
-                "grade_estimate": 5.0,
-                "centering_cap": 10,
-                "centering_score": 5.0,
-                "centering_avg_score": 5.0,
-            }
-        corners = get_card_corners(card_contour)
-        corrected = perspective_correct_card(image, corners)
+        cache_key = _file_version(image_path) if image_path is not None else None
+        corrected = _get_cached_corrected(cache_key)
+        if corrected is None:
+            card_contour = find_card_contour(image)
+            if card_contour is None:
+                return {
+                    "success": False,
+                    "error": "Could not detect card boundary",
+                    "score": 5.0,
+                    "grade_estimate": 5.0,
+                    "centering_cap": 10,
+                    "centering_score": 5.0,
+                    "centering_avg_score": 5.0,
+                }
+            corners = get_card_corners(card_contour)
+            corrected = perspective_correct_card(image, corners)
+            _put_cached_corrected(cache_key, corrected)
 
     img_height, img_width = corrected.shape[:2]
+    # Border positions only need the warp's native resolution; blur, Canny,
+    # Sobel and contour tracing on a multi-megapixel pre-corrected photo is
+    # wasted work. Widths are mapped back to full resolution afterwards.
+    analysis_scale = max(img_height, img_width) / CENTERING_ANALYSIS_MAX_DIM
+    if analysis_scale > 1.0:
+        analysis_img = cv2.resize(
+            corrected,
+            (round(img_width / analysis_scale), round(img_height / analysis_scale)),
+            interpolation=cv2.INTER_AREA,
+        )
+    else:
+        analysis_scale = 1.0
+        analysis_img = corrected
+    card_height, card_width = analysis_img.shape[:2]
+    # Gray/HSV/blurred views are computed once and shared by every method below.
+    card = PreprocessedCard(analysis_img)
 
     # Method 1: Detect inner artwork box
-    artwork_box = detect_inner_artwork_box(corrected)
+    artwork_box = detect_inner_artwork_box(card)
     detection_method = "artwork_box"
     
     if artwork_box is not None:
         # Primary method: use artwork box boundaries
         x, y, w, h = artwork_box
         left = x
-        right = img_width - (x + w)
+        right = card_width - (x + w)
         top = y
-        bottom = img_height - (y + h)
+        bottom = card_height - (y + h)
         
         # Validate artwork box result
         lr_ratio = min(left, right) / max(left, right) if max(left, right) > 0 else 1.0
@@ -655,7 +896,7 @@ def calculate_centering_ratios(
         # Method 2: HSV outermost-colour detection — finds the true print border
         # rather than firing on the artwork frame like gradient detection can.
         detection_method = "hsv_border"
-        hsv_result = detect_border_widths_hsv(corrected)
+        hsv_result = detect_border_widths_hsv(card)
         if hsv_result is not None:
             left, right, top, bottom = hsv_result
             lr_ratio = min(left, right) / max(left, right) if max(left, right) > 0 else 1.0
@@ -667,7 +908,7 @@ def calculate_centering_ratios(
         if hsv_result is None:
             # Method 3: gradient-based border detection (fallback)
             detection_method = "gradient_detection"
-            left, right, top, bottom, symmetry_corrected, cross_axis_unreliable = detect_border_widths_gradient(corrected)
+            left, right, top, bottom, symmetry_corrected, cross_axis_unreliable = detect_border_widths_gradient(card)
 
             # Validate gradient result
             lr_ratio = min(left, right) / max(left, right) if max(left, right) > 0 else 1.0
@@ -677,9 +918,14 @@ def calculate_centering_ratios(
                 # Still unreliable, try saturation fallback
                 logger.warning(f"Gradient centering looks unreliable (lr={lr_ratio:.2f}, tb={tb_ratio:.2f}), trying saturation method")
                 detection_method = "border_detection"
-                left, right, top, bottom = detect_border_widths(corrected)
+                left, right, top, bottom = detect_border_widths(card)
                 symmetry_corrected = False
 
+    # Box and gradient scans measure whole pixels, HSV fractional ones.
+    integer_widths = isinstance(left, (int, np.integer))
+    if analysis_scale != 1.0:
+        left, right, top, bottom = (v * analysis_scale for v in (left, right, top, bottom))
+
     # Final validation: if ALL methods give extreme asymmetry,
     # it's likely a detection issue, not actual centering
     lr_ratio = min(left, right) / max(left, right) if max(left, right) > 0 else 1.0
@@ -700,28 +946,27 @@ def calculate_centering_ratios(
         score = calculate_centering_score(left, right, top, bottom)
     
     cap, cap_score = _centering_cap_and_score(lr_ratio, tb_ratio, is_front)
-    logger.info(
-        f"Centering via {detection_method}: "
-        f"L={left:.0f} R={right:.0f} T={top:.0f} B={bottom:.0f} "
-        f"lr_ratio={lr_ratio:.3f} tb_ratio={tb_ratio:.3f} "
-        f"score={score:.1f} cap={cap} cap_score={cap_score}"
-    )
-
-    # Calculate percentages for display
-    total_lr = left + right
-    total_tb = top + bottom
+    # Emitted on every call; skip building the f-string when INFO is filtered out.
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            f"Centering via {detection_method}: "
+            f"L={left:.0f} R={right:.0f} T={top:.0f} B={bottom:.0f} "
+            f"lr_ratio={lr_ratio:.3f} tb_ratio={tb_ratio:.3f} "
+            f"score={score:.1f} cap={cap} cap_score={cap_score}"
+        )
 
-    left_pct = (left / total_lr * 100) if total_lr > 0 else 50.0
-    right_pct = (right / total_lr * 100) if total_lr > 0 else 50.0
-    top_pct = (top / total_tb * 100) if total_tb > 0 else 50.0
-    bottom_pct = (bottom / total_tb * 100) if total_tb > 0 else 50.0
-    
     # Debug visualization
     if debug_output_path:
-        debug_img = corrected.copy()
+        # Measurement is finished, so draw straight onto the corrected card;
+        # only a cached (read-only, shared) card or the caller's array needs a
+        # private copy.
+        if corrected.flags.writeable and corrected is not caller_image:
+            debug_img = corrected
+        else:
+            debug_img = corrected.copy()
         
         if artwork_box is not None:
-            x, y, w, h = artwork_box
+            x, y, w, h = (int(round(v * analysis_scale)) for v in artwork_box)
             cv2.rectangle(debug_img, (x, y), (x + w, y + h), (0, 255, 0), 2)
         else:
             # Draw border measurement lines
@@ -770,6 +1015,13 @@ def calculate_centering_ratios(
     elif symmetry_corrected:
         confidence = min(confidence, 0.6)
     
+    measurements = _border_measurements(left, right, top, bottom)
+    if integer_widths and analysis_scale != 1.0:
+        # Report scaled-back widths as whole pixels, as at native size; the
+        # ratios and score above use the unrounded values.
+        for side in ("left_px", "right_px", "top_px", "bottom_px"):
+            measurements[side] = int(round(measurements[side]))
+
     return {
         "success": True,
         "score": round(score, 1),
@@ -777,16 +1029,44 @@ def calculate_centering_ratios(
         "detection_method": detection_method,
         "lr_ratio": round(lr_ratio, 4),
         "tb_ratio": round(tb_ratio, 4),
-        "measurements": {
-            "left_px": left,
-            "right_px": right,
-            "top_px": top,
-            "bottom_px": bottom,
-            "left_right_ratio": f"{left_pct:.1f}/{right_pct:.1f}",
-            "top_bottom_ratio": f"{top_pct:.1f}/{bottom_pct:.1f}"
-        },
+        "measurements": measurements,
         "confidence": confidence,
         "centering_cap": cap,
         "centering_score": cap_score,        # worst-axis — used for cap enforcement
         "centering_avg_score": round(score, 2),  # average-axis — used for half-point gate
     }
+
+
+def calculate_centering_ratios_batch(
+    image_paths: Sequence[str],
+    is_front: bool = True,
+    already_corrected: bool = False,
+    max_workers: int = 4,
+) -> List[Dict]:
+    """
+    Run calculate_centering_ratios over several cards.
+
+    Decoding and the OpenCV passes release the GIL, so cards are analysed
+    concurrently on a small thread pool; each worker thread keeps its own
+    scratch buffers, and the corrected-card cache is shared.
+
+    Args:
+        image_paths: Paths to card images
+        is_front: Passed through to calculate_centering_ratios
+        already_corrected: Passed through to calculate_centering_ratios
+        max_workers: Upper bound on worker threads
+
+    Returns:
+        One result dict per path, in input order
+    """
+    if not image_paths:
+        return []
+
+    def analyse(path: str) -> Dict:
+        return calculate_centering_ratios(
+            path, is_front=is_front, already_corrected=already_corrected,
+        )
+
+    workers = max(1, min(max_workers, len(image_paths)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="centering") as pool:
+        return list(pool.map(analyse, image_paths))
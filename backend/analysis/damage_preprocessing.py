@@ -10,6 +10,8 @@ import cv2
 import numpy as np
 from typing import Optional, Tuple
 
+from analysis.preprocessed import PreprocessedCard
+
 logger = logging.getLogger(__name__)
 
 # Attempt to import centering art box detection; graceful fallback if unavailable
@@ -46,6 +48,8 @@ def enhance_for_damage_detection(img: np.ndarray) -> np.ndarray:
         Safe to pass directly to Vision AI (still a normal 3-channel image).
     """
     h, w = img.shape[:2]
+    # Art box detection and the grayscale step below share one conversion.
+    card = PreprocessedCard(img)
 
     # ─────────────────────────────────────────────────────────────────────
     # Step 1: Detect artwork box or use fixed margin fallback
@@ -53,7 +57,7 @@ def enhance_for_damage_detection(img: np.ndarray) -> np.ndarray:
 
     if ART_BOX_AVAILABLE:
         try:
-            art_box = detect_inner_artwork_box(img)
+            art_box = detect_inner_artwork_box(card)
             if art_box is not None:
                 # Returns (x, y, box_w, box_h) tuple from centering.py
                 bx, by, bw_box, bh_box = art_box
@@ -93,7 +97,7 @@ def enhance_for_damage_detection(img: np.ndarray) -> np.ndarray:
     # Step 2: Convert to grayscale (removes holographic colour noise)
     # ─────────────────────────────────────────────────────────────────────
 
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    gray = card.gray
 
     # ─────────────────────────────────────────────────────────────────────
     # Step 4: Split-region enhancement
@@ -114,7 +118,7 @@ def enhance_for_damage_detection(img: np.ndarray) -> np.ndarray:
 
     # Skip histogram equalization on white-dominant cards (Mewtwo, Alakazam, etc.)
     # equalizeHist on a near-white histogram compresses it → masks wear signals
-    border_gray_mean = float(np.mean(gray[border_mask == 255])) if np.any(border_mask) else 0.0
+    border_gray_mean = cv2.mean(gray, mask=border_mask)[0] if cv2.countNonZero(border_mask) else 0.0
     if border_gray_mean < 200:
         border_pixels = cv2.equalizeHist(border_pixels)
     else:
@@ -0,0 +1,70 @@
+"""
+Shared colour-space views of a card image.
+
+Several analyzers start from the same perspective-corrected card and each
+converted it to grayscale/HSV (and blurred it) on its own. PreprocessedCard
+computes those views on first use and hands the same arrays to every
+analyzer that receives the card.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Union
+
+import cv2
+import numpy as np
+
+
+@dataclass
+class PreprocessedCard:
+    """BGR card image plus lazily computed, memoised gray / HSV / blurred views."""
+
+    bgr: np.ndarray
+    _gray: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+    _hsv: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+    _blurred: Dict[int, np.ndarray] = field(default_factory=dict, init=False, repr=False)
+
+    @property
+    def shape(self):
+        return self.bgr.shape
+
+    @property
+    def gray(self) -> np.ndarray:
+        if self._gray is None:
+            self._gray = cv2.cvtColor(self.bgr, cv2.COLOR_BGR2GRAY)
+        return self._gray
+
+    @property
+    def hsv(self) -> np.ndarray:
+        if self._hsv is None:
+            self._hsv = cv2.cvtColor(self.bgr, cv2.COLOR_BGR2HSV)
+        return self._hsv
+
+    def blurred_gray(self, ksize: int) -> np.ndarray:
+        """Gray view Gaussian-blurred with a ksize x ksize kernel (sigma from ksize)."""
+        blurred = self._blurred.get(ksize)
+        if blurred is None:
+            blurred = cv2.GaussianBlur(self.gray, (ksize, ksize), 0)
+            self._blurred[ksize] = blurred
+        return blurred
+
+
+def as_preprocessed(image: Union[np.ndarray, PreprocessedCard]) -> PreprocessedCard:
+    """Wrap a raw BGR array; pass an existing PreprocessedCard through unchanged."""
+    if isinstance(image, PreprocessedCard):
+        return image
+    return PreprocessedCard(image)
+
+
+def read_image(path: str) -> Optional[np.ndarray]:
+    """
+    cv2.imread equivalent that decodes from a single buffered read of the file.
+
+    Returns None for a missing, empty or undecodable file, like cv2.imread.
+    EXIF orientation is applied the same way.
+    """
+    try:
+        buf = np.fromfile(path, dtype=np.uint8)
+    except OSError:
+        return None
+    if buf.size == 0:
+        return None
+    return cv2.imdecode(buf, cv2.IMREAD_COLOR)
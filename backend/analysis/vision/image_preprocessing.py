@@ -9,6 +9,10 @@ from typing import Optional, Tuple
 POKEMON_CARD_ASPECT_RATIO = 2.5 / 3.5  # Width / Height = ~0.714
 ASPECT_RATIO_TOLERANCE = 0.08  # ±8% tolerance
 
+# Card-mask cleanup kernels (rectangular), built once at import.
+_MASK_OPEN_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
+_MASK_CLOSE_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (9, 9))
+
 
 def enhance_card_image(image: np.ndarray) -> np.ndarray:
     """
@@ -64,13 +68,11 @@ def create_card_mask(image: np.ndarray) -> np.ndarray:
     combined = cv2.bitwise_or(adaptive, otsu)
     
     # Morphological operations to clean up
-    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
-    
-    # Close small gaps
-    combined = cv2.morphologyEx(combined, cv2.MORPH_CLOSE, kernel, iterations=2)
+    # Close small gaps (one 9x9 pass == two 5x5 iterations for a rect kernel)
+    combined = cv2.morphologyEx(combined, cv2.MORPH_CLOSE, _MASK_CLOSE_KERNEL)
     
     # Remove small noise
-    combined = cv2.morphologyEx(combined, cv2.MORPH_OPEN, kernel, iterations=1)
+    combined = cv2.morphologyEx(combined, cv2.MORPH_OPEN, _MASK_OPEN_KERNEL, iterations=1)
     
     return combined
 
@@ -17,7 +17,9 @@ def calculate_blur_score(image: np.ndarray) -> float:
         Blur score (higher = sharper, typically >100 is good)
     """
     gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    laplacian = cv2.Laplacian(gray, cv2.CV_64F)
+    # 3x3 Laplacian of uint8 stays within +-1020, so CV_16S holds it exactly at
+    # a quarter of the CV_64F footprint; .var() still accumulates in float64.
+    laplacian = cv2.Laplacian(gray, cv2.CV_16S)
     variance = laplacian.var()
     return variance
 
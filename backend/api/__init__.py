@@ -1,3 +1,28 @@
 """API package for Pregrader backend."""
-from .session_manager import GradingSession, SessionManager, get_session_manager
-from .combined_grading import analyze_single_side, combine_front_back_analysis
+import importlib
+
+# Public names resolved on first access (PEP 562), so importing a lightweight
+# submodule such as api.session_manager doesn't pull in OpenCV via
+# combined_grading.
+_LAZY_EXPORTS = {
+    "GradingSession": ".session_manager",
+    "SessionManager": ".session_manager",
+    "get_session_manager": ".session_manager",
+    "analyze_single_side": ".combined_grading",
+    "combine_front_back_analysis": ".combined_grading",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
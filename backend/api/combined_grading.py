@@ -14,6 +14,7 @@ from pathlib import Path
 
 from analysis.centering import calculate_centering_ratios
 from analysis.damage_preprocessing import enhance_for_damage_detection
+from analysis.preprocessed import read_image
 from analysis.texture import detect_border_wear
 from analysis.creases import detect_surface_creases
 from grading.vision_assessor import assess_card, assess_damage_from_full_images, VisionAssessorError
@@ -28,6 +29,17 @@ from grading.grade_assembler import (
 
 logger = logging.getLogger(__name__)
 
+# HSV inRange bounds for detect_card_side (OpenCV 8-bit HSV scale)
+_BLUE_LOWER = np.array([90, 50, 30], dtype=np.uint8)
+_BLUE_UPPER = np.array([140, 255, 255], dtype=np.uint8)
+_YELLOW_LOWER = np.array([20, 80, 100], dtype=np.uint8)
+_YELLOW_UPPER = np.array([40, 255, 255], dtype=np.uint8)
+# Red wraps around hue 0: hue 0-10 or 160-180, both with S and V >= 80.
+_RED_SV_LOWER = np.array([0, 80, 80], dtype=np.uint8)
+_RED_SV_UPPER = np.array([180, 255, 255], dtype=np.uint8)
+_RED_LOW_HUE_MAX = 10
+_RED_HIGH_HUE_MIN = 160
+
 
 def detect_card_side(image: np.ndarray) -> Tuple[str, float]:
     """
@@ -38,20 +50,29 @@ def detect_card_side(image: np.ndarray) -> Tuple[str, float]:
     (Inlined from analysis/deprecated/edges.py to remove dependency on deprecated module.)
     """
     hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
-    blue_mask = cv2.inRange(hsv, np.array([90, 50, 30]), np.array([140, 255, 255]))
+    blue_mask = cv2.inRange(hsv, _BLUE_LOWER, _BLUE_UPPER)
     blue_pct = cv2.countNonZero(blue_mask) / blue_mask.size * 100
-    yellow_mask = cv2.inRange(hsv, np.array([20, 80, 100]), np.array([40, 255, 255]))
+
+    # Blue alone decides anything that can't be a back; only a blue-dominant
+    # image needs the yellow and red masks.
+    if blue_pct < 20:
+        return "front", min(1.0, (100 - blue_pct) / 80)
+    if blue_pct <= 55:
+        return "front", 0.6
+
+    yellow_mask = cv2.inRange(hsv, _YELLOW_LOWER, _YELLOW_UPPER)
     yellow_pct = cv2.countNonZero(yellow_mask) / yellow_mask.size * 100
     # Red mask for Pokeball detection (backs have a red Pokeball center)
-    red_mask1 = cv2.inRange(hsv, np.array([0, 80, 80]), np.array([10, 255, 255]))
-    red_mask2 = cv2.inRange(hsv, np.array([160, 80, 80]), np.array([180, 255, 255]))
-    red_pct = (cv2.countNonZero(red_mask1) + cv2.countNonZero(red_mask2)) / blue_mask.size * 100
+    # One S/V mask plus a hue histogram under it counts both red bands in a
+    # single pass, instead of an inRange mask and countNonZero per band.
+    red_sv_mask = cv2.inRange(hsv, _RED_SV_LOWER, _RED_SV_UPPER)
+    hue_hist = cv2.calcHist([hsv], [0], red_sv_mask, [181], [0, 181]).ravel()
+    red_count = hue_hist[:_RED_LOW_HUE_MAX + 1].sum() + hue_hist[_RED_HIGH_HUE_MIN:].sum()
+    red_pct = float(red_count) / blue_mask.size * 100
 
     # Backs require both high blue AND some red (Pokeball) — reduces false positives
-    if blue_pct > 55 and yellow_pct < 5 and red_pct > 2:
+    if yellow_pct < 5 and red_pct > 2:
         return "back", min(1.0, blue_pct / 70)
-    if blue_pct < 20:
-        return "front", min(1.0, (100 - blue_pct) / 80)
     return "front", 0.6
 
 
@@ -90,7 +111,7 @@ def analyze_single_side(
         "errors": [],
     }
 
-    image = cv2.imread(image_path)
+    image = read_image(image_path)
     if image is None:
         results["errors"].append("Failed to load image")
         return results
@@ -108,8 +129,10 @@ def analyze_single_side(
             centering_path = str(debug_output_dir / f"{side}_centering.jpg")
         vision_border_fractions = detection_data.get("border_fractions") if detection_data else None
         already_corrected = bool(detection_data.get("already_corrected")) if detection_data else False
+        # Pre-warped cards reuse the decode above; raw uploads go by path so the
+        # corrected-card cache can key on the file.
         results["centering"] = calculate_centering_ratios(
-            image_path,
+            image if already_corrected else image_path,
             debug_output_path=centering_path,
             vision_border_fractions=vision_border_fractions,
             is_front=is_front,
@@ -438,8 +461,8 @@ def combine_front_back_analysis(
         combined["warnings"].append("Could not load images for Vision AI assessment")
         return combined
 
-    front_img = cv2.imread(front_path)
-    back_img = cv2.imread(back_path)
+    front_img = read_image(front_path)
+    back_img = read_image(back_path)
 
     if front_img is None or back_img is None:
         combined["grade"] = {
@@ -3,12 +3,17 @@
 Startup check script to verify all dependencies are working correctly.
 Run this before starting the server to catch configuration issues early.
 """
+import os
 import sys
 import logging
+from pathlib import Path
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Resolved once; the directory checks below are all relative to the backend root.
+BACKEND_DIR = Path(__file__).parent
+
 def check_opencv():
     """Check if OpenCV is properly installed and working."""
     try:
@@ -38,8 +43,13 @@ def check_numpy():
 def check_fastapi():
     """Check if FastAPI is installed."""
     try:
-        import fastapi
-        logger.info(f"✓ FastAPI version: {fastapi.__version__}")
+        # Only presence and version are checked here, so read the package
+        # metadata rather than importing fastapi (and pydantic/starlette with it).
+        from importlib.metadata import version
+        from importlib.util import find_spec
+        if find_spec("fastapi") is None:
+            raise ImportError("No module named 'fastapi'")
+        logger.info(f"✓ FastAPI version: {version('fastapi')}")
         return True
     except Exception as e:
         logger.error(f"✗ FastAPI check failed: {e}")
@@ -48,8 +58,7 @@ def check_fastapi():
 def check_temp_directory():
     """Check if temp directory can be created."""
     try:
-        from pathlib import Path
-        temp_dir = Path(__file__).parent / "temp_uploads"
+        temp_dir = BACKEND_DIR / "temp_uploads"
         temp_dir.mkdir(exist_ok=True)
         logger.info(f"✓ Temp directory accessible: {temp_dir}")
         return True
@@ -59,7 +68,6 @@ def check_temp_directory():
 
 def check_api_key():
     """Check if ANTHROPIC_API_KEY is set."""
-    import os
     key = os.getenv("ANTHROPIC_API_KEY")
     if key:
         logger.info(f"✓ ANTHROPIC_API_KEY is set ({len(key)} chars)")
@@ -70,8 +78,7 @@ def check_api_key():
 
 def check_grading_prompt():
     """Check if grading_prompt.txt exists and is non-empty."""
-    from pathlib import Path
-    prompt_path = Path(__file__).parent / "grading" / "prompts" / "grading_prompt.txt"
+    prompt_path = BACKEND_DIR / "grading" / "prompts" / "grading_prompt.txt"
     if not prompt_path.exists():
         logger.error(f"✗ Grading prompt not found at {prompt_path}")
         return False
@@ -0,0 +1,22 @@
+import sys
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+# Backend modules import each other as top-level packages (analysis, api, ...).
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture
+def card_paths(tmp_path):
+    """Three pre-corrected 500x700 cards on disk, each off-centre differently."""
+    paths = []
+    for i, (left, top) in enumerate([(30, 40), (45, 25), (20, 55)]):
+        image = np.full((700, 500, 3), (40, 200, 230), dtype=np.uint8)
+        image[top:700 - 40, left:500 - 30] = (120, 90, 60)
+        path = tmp_path / f"card_{i}.png"
+        cv2.imwrite(str(path), image)
+        paths.append(str(path))
+    return paths
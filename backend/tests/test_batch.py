@@ -0,0 +1,59 @@
+import cv2
+import numpy as np
+
+from analysis import batch
+from analysis.batch import _analyze_one, grade_batch
+from analysis.centering import calculate_centering_ratios
+from analysis.corners import analyze_corners
+from analysis.vision.image_preprocessing import (
+    find_card_contour,
+    get_card_corners,
+    perspective_correct_card,
+)
+
+
+def test_grade_batch_pool_matches_serial(card_paths):
+    results = grade_batch(card_paths, already_corrected=True, max_workers=2)
+
+    expected = [_analyze_one(p, True, True) for p in card_paths]
+    assert results == expected
+    assert all(r["centering"] and r["corners"] and not r["errors"] for r in results)
+
+
+def test_grade_batch_records_unreadable_file(card_paths, tmp_path):
+    corrupt = tmp_path / "corrupt.jpg"
+    corrupt.write_bytes(b"not an image")
+    paths = [card_paths[0], str(corrupt), str(tmp_path / "missing.png")]
+
+    results = grade_batch(paths, already_corrected=True, max_workers=2)
+
+    assert [r["image_path"] for r in results] == paths
+    assert results[0] == _analyze_one(card_paths[0], True, True)
+    for failed in results[1:]:
+        assert failed["errors"] == ["Failed to load image"]
+        assert failed["centering"] is None and failed["corners"] is None
+
+
+def test_grade_batch_empty():
+    assert grade_batch([]) == []
+
+
+def test_grade_batch_raw_photo_grades_warped_card(tmp_path, monkeypatch):
+    scene = np.full((1000, 800, 3), (20, 20, 20), dtype=np.uint8)
+    scene[150:850, 150:650] = (40, 200, 230)
+    scene[190:810, 180:620] = (120, 90, 60)
+    path = tmp_path / "raw.png"
+    cv2.imwrite(str(path), scene)
+    graded = []
+    monkeypatch.setattr(
+        batch, "analyze_corners",
+        lambda image, side: graded.append(image) or analyze_corners(image, side=side),
+    )
+
+    result = _analyze_one(str(path), True, False)
+
+    warped = perspective_correct_card(scene, get_card_corners(find_card_contour(scene)))
+    assert not result["errors"]
+    assert len(graded) == 1 and np.array_equal(graded[0], warped)
+    assert result["corners"] == analyze_corners(warped, side="front")
+    assert result["centering"] == calculate_centering_ratios(str(path))
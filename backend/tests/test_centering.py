@@ -0,0 +1,58 @@
+import cv2
+import numpy as np
+
+from analysis.centering import (
+    CENTERING_SCORE_RATIOS,
+    calculate_centering_ratios,
+    calculate_centering_ratios_batch,
+    calculate_centering_score,
+    calculate_centering_scores,
+)
+
+
+def test_calculate_centering_scores_matches_scalar():
+    rng = np.random.default_rng(0)
+    borders = [tuple(row) for row in rng.uniform(0, 60, (200, 4))]
+    # Exact table breakpoints (both axes at the ratio), perfect centring,
+    # ratios past both ends of the table, and all-zero / one-sided borders.
+    for ratio in list(CENTERING_SCORE_RATIOS) + [0.0, 0.1, 1.0]:
+        borders.append((ratio * 40, 40.0, 40.0, ratio * 40))
+    borders += [(0.0, 0.0, 0.0, 0.0), (0.0, 30.0, 20.0, 20.0), (25.0, 25.0, 0.0, 0.0)]
+
+    batch = calculate_centering_scores(np.array(borders))
+
+    expected = [calculate_centering_score(*row) for row in borders]
+    assert batch.tolist() == expected
+
+
+def test_centering_batch_matches_serial(card_paths):
+    batch = calculate_centering_ratios_batch(card_paths, already_corrected=True)
+
+    expected = [calculate_centering_ratios(p, already_corrected=True) for p in card_paths]
+    assert batch == expected
+    # Each card is off-centre differently, so equality also pins input order.
+    assert len({r["measurements"]["left_px"] for r in batch}) == len(card_paths)
+
+
+def test_centering_batch_empty():
+    assert calculate_centering_ratios_batch([]) == []
+
+
+def _framed_card(scale):
+    """Pre-corrected card with a dark artwork frame, drawn at `scale` x 500x700."""
+    image = np.full((700 * scale, 500 * scale, 3), 230, dtype=np.uint8)
+    image[40 * scale:-40 * scale, 30 * scale:-45 * scale] = 200
+    cv2.rectangle(image, (60 * scale, 70 * scale), (425 * scale, 630 * scale), (20, 20, 20), 3 * scale)
+    return image
+
+
+def test_oversized_corrected_card_measured_at_native_resolution():
+    native = calculate_centering_ratios(_framed_card(1), already_corrected=True)
+    oversized = calculate_centering_ratios(_framed_card(2), already_corrected=True)
+
+    assert oversized["detection_method"] == native["detection_method"] == "artwork_box"
+    assert oversized["score"] == native["score"]
+    for side in ("left_px", "right_px", "top_px", "bottom_px"):
+        # Widths come back in the input's pixels, with the method's int type.
+        assert type(oversized["measurements"][side]) is int
+        assert abs(oversized["measurements"][side] - 2 * native["measurements"][side]) <= 2
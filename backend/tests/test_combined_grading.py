@@ -0,0 +1,55 @@
+import cv2
+import numpy as np
+import pytest
+
+from api.combined_grading import detect_card_side
+
+
+def _reference_side(image):
+    """Straight three-mask form of the side classifier, full resolution."""
+    hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+    size = hsv.shape[0] * hsv.shape[1]
+    blue_pct = cv2.countNonZero(cv2.inRange(hsv, (90, 50, 30), (140, 255, 255))) / size * 100
+    yellow_pct = cv2.countNonZero(cv2.inRange(hsv, (20, 80, 100), (40, 255, 255))) / size * 100
+    red = (
+        cv2.countNonZero(cv2.inRange(hsv, (0, 80, 80), (10, 255, 255)))
+        + cv2.countNonZero(cv2.inRange(hsv, (160, 80, 80), (180, 255, 255)))
+    )
+    red_pct = red / size * 100
+    if blue_pct > 55 and yellow_pct < 5 and red_pct > 2:
+        return "back", min(1.0, blue_pct / 70)
+    if blue_pct < 20:
+        return "front", min(1.0, (100 - blue_pct) / 80)
+    return "front", 0.6
+
+
+def _card(base_bgr, inner_bgr=None, ball=False, h=1400, w=1000):
+    image = np.full((h, w, 3), base_bgr, dtype=np.uint8)
+    if inner_bgr is not None:
+        image[h // 8:h // 2, w // 10:w - w // 10] = inner_bgr
+    if ball:
+        cv2.circle(image, (w // 2, h // 2), w // 6, (30, 30, 220), -1)
+    rng = np.random.default_rng(0)
+    noise = rng.integers(-12, 13, image.shape)
+    return np.clip(image.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+
+
+CARDS = {
+    "plain_front": _card((40, 200, 230)),
+    "yellow_front": _card((40, 200, 230), inner_bgr=(120, 90, 60)),
+    "blue_art_front": _card((40, 200, 230), inner_bgr=(200, 80, 20)),
+    "back": _card((190, 70, 20), ball=True),
+    "blue_no_ball": _card((190, 70, 20)),
+    "blue_with_yellow": _card((190, 70, 20), inner_bgr=(40, 200, 230), ball=True),
+}
+
+
+@pytest.mark.parametrize("name", sorted(CARDS))
+def test_detect_card_side_matches_reference(name):
+    assert detect_card_side(CARDS[name]) == _reference_side(CARDS[name])
+
+
+def test_detect_card_side_decisions():
+    assert detect_card_side(CARDS["plain_front"]) == ("front", 1.0)
+    assert detect_card_side(CARDS["yellow_front"])[0] == "front"
+    assert detect_card_side(CARDS["back"])[0] == "back"
@@ -0,0 +1,21 @@
+import numpy as np
+
+from analysis.corners import CornerDetector
+
+
+def _card_on_flat_background(h=2100, w=1500, margin=30):
+    """Clean yellow-bordered card photographed on a uniform dark surface."""
+    image = np.full((h, w, 3), 25, dtype=np.uint8)
+    image[margin:h - margin, margin:w - margin] = (40, 200, 230)
+    image[margin + 200:margin + 1100, margin + 130:w - margin - 130] = (120, 90, 60)
+    return image
+
+
+def test_flat_background_corners_stay_valid():
+    # A flat background must not be mistaken for a card border running to the
+    # frame edge; every corner is on the card and is clean.
+    result = CornerDetector().analyze_corners(_card_on_flat_background())
+
+    assert result["individual_scores"] == [10.0, 10.0, 10.0, 10.0]
+    assert result["false_positives_filtered"] == 0
+    assert result["confidence"] == 0.9
@@ -0,0 +1,14 @@
+import numpy as np
+
+from analysis.vision.image_preprocessing import find_card_contour
+
+
+def test_precropped_card_contour_is_full_resolution():
+    # A phone-sized, card-aspect photo with no separate outline falls back to
+    # the whole frame, in the input's own pixel coordinates.
+    h, w = 4200, 3000
+    image = np.full((h, w, 3), (40, 200, 230), dtype=np.uint8)
+
+    contour = find_card_contour(image)
+
+    assert contour.reshape(-1, 2).tolist() == [[0, 0], [w - 1, 0], [w - 1, h - 1], [0, h - 1]]
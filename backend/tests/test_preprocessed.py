@@ -0,0 +1,64 @@
+import cv2
+import numpy as np
+import pytest
+
+from analysis.preprocessed import PreprocessedCard, as_preprocessed, read_image
+
+
+@pytest.fixture
+def bgr():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, (70, 50, 3), dtype=np.uint8)
+
+
+def test_views_match_direct_conversions(bgr):
+    card = PreprocessedCard(bgr)
+
+    assert np.array_equal(card.gray, cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY))
+    assert np.array_equal(card.hsv, cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV))
+    for ksize in (3, 5):
+        expected = cv2.GaussianBlur(cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY), (ksize, ksize), 0)
+        assert np.array_equal(card.blurred_gray(ksize), expected)
+
+
+def test_views_are_cached(bgr):
+    card = PreprocessedCard(bgr)
+
+    assert card.gray is card.gray
+    assert card.hsv is card.hsv
+    assert card.blurred_gray(5) is card.blurred_gray(5)
+    assert card.blurred_gray(3) is not card.blurred_gray(5)
+
+
+def test_as_preprocessed(bgr):
+    card = as_preprocessed(bgr)
+    assert isinstance(card, PreprocessedCard)
+    assert card.bgr is bgr
+    assert card.shape == bgr.shape
+    assert as_preprocessed(card) is card
+
+
+def test_read_image_matches_imread(bgr, tmp_path):
+    path = tmp_path / "card.png"
+    cv2.imwrite(str(path), bgr)
+
+    assert np.array_equal(read_image(str(path)), cv2.imread(str(path)))
+
+
+def test_read_image_non_ascii_path(bgr, tmp_path):
+    path = tmp_path / "carte_pokémon_ピカチュウ.png"
+    cv2.imencode(".png", bgr)[1].tofile(str(path))
+
+    assert np.array_equal(read_image(str(path)), bgr)
+
+
+def test_read_image_unreadable_returns_none(tmp_path):
+    corrupt = tmp_path / "corrupt.jpg"
+    corrupt.write_bytes(b"not an image")
+    empty = tmp_path / "empty.jpg"
+    empty.write_bytes(b"")
+
+    assert read_image(str(tmp_path / "missing.jpg")) is None
+    assert read_image(str(corrupt)) is None
+    assert read_image(str(empty)) is None
+    assert read_image(str(tmp_path)) is None